@@ -1,19 +1,77 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+import tkinter.font as tkfont
 import socket
 import threading
 import math
 import time
 import queue
+from link_health import LinkHealth, HEALTH_COLORS
+from log_store import LogStore, LogView
+from timeline import Timeline, EV_POSE
+from dead_reckoning import DeadReckoner
 
 # --- CONFIGURATION ---
 CYBOT_IP = "192.168.1.1"  
 CYBOT_PORT = 288          
+SPLIT_MODE = False  # Run socket + parsing in a worker process (see telemetry_worker.py)
+DIAGNOSTICS = False # Start with the profiler panel open (toggle at runtime with F12)
 # ---------------------
 
+# --- RENDER QUALITY ---
+# Level 0 is full detail; higher levels are used while draw_map runs over budget.
+# labels: label every Nth grid line (0 = none), max_objects / max_path: points drawn
+QUALITY_LEVELS = [
+    {"labels": 1, "max_objects": None, "max_path": None, "frame_ms": 33},
+    {"labels": 2, "max_objects": 2000, "max_path": 2000, "frame_ms": 50},
+    {"labels": 4, "max_objects": 500,  "max_path": 500,  "frame_ms": 100},
+    {"labels": 0, "max_objects": 200,  "max_path": 200,  "frame_ms": 200},
+]
+FRAME_BUDGET_MS = 12    # Step down when the average draw cost exceeds this
+RECOVER_FRAMES = 30     # Real draws at a level before its cost is trusted for stepping up
+PROBE_FRAMES = 60       # Draws well under budget before trying one level up anyway
+PROBE_MAX_FRAMES = 960  # Cap for the probe wait, which doubles after each failed probe
+QUEUE_BUDGET_S = 0.02   # Max time per process_queue pass so key presses still get through
+WORKER_BATCH = 2000     # Max ring records applied per pass in split mode
+# ---------------------
+
+# --- MAP LAYERS ---
+MIN_GRID_PX = 40        # Grid spacing grows with zoom-out so lines stay at least this far apart
+PATH_SEGMENT_LIMIT = 64 # Per-frame path segments before they are merged into one line
+SCRUB_STEPS = 1000      # Resolution of the mission timeline slider
+# ---------------------
+
+# --- LOG FILTERS ---
+LOG_TAGS = ["All", "RX", "CMD", "Sys", "REQ", "Parse Error", "Error"]
+LOG_SPANS = {"All time": None, "1 min": 60, "10 min": 600, "1 hour": 3600}
+LOG_REFRESH_MS = 100
+# ---------------------
+
+def decimate(points, max_points):
+    # Evenly thin a point list down to about max_points, keeping the last point
+    if max_points is None or len(points) <= max_points:
+        return points
+    step = -(-len(points) // max_points)
+    thinned = points[::step]
+    if thinned[-1] != points[-1]:
+        thinned.append(points[-1])
+    return thinned
+
+def grid_spacing(scale):
+    # Smallest 1-2-5 step (cm) that keeps grid lines at least MIN_GRID_PX apart
+    magnitude = 10
+    while True:
+        for mult in (1, 2, 5):
+            if magnitude * mult * scale >= MIN_GRID_PX:
+                return magnitude * mult
+        magnitude *= 10
+
 class CyBotGUI:
-    def __init__(self, root):
+    def __init__(self, root, host=CYBOT_IP, port=CYBOT_PORT, split_mode=SPLIT_MODE, diagnostics=DIAGNOSTICS,
+                 replay=None):
         self.root = root
+        self.host = host
+        self.port = port
         self.root.title("CyBot Mission Control")
         self.root.geometry("1000x700")
         self.root.configure(bg="#2c3e50")
@@ -22,14 +80,32 @@ class CyBotGUI:
         self.connected = False
         self.socket = None
         self.msg_queue = queue.Queue()
+        self.worker = None
+        self.rec = None  # telemetry_worker module (record kinds) in split mode
+        self.dropped_reported = 0
+        self.link = LinkHealth()
+        self.last_chunk_t = None
+
+        # Telemetry log history (widget shows one page of log_view at a time)
+        self.log_store = LogStore()
+        self.log_view = LogView(self.log_store)
+        self.log_top = 0
+        self.log_follow = True
+        self.log_dirty = True
+        self.log_filter_job = None
         
         # Robot State (Dead Reckoning)
         self.bot_x = 0.0
         self.bot_y = 0.0 
         self.bot_heading = 90.0 
+        self.reckoner = DeadReckoner(self.bot_x, self.bot_y, self.bot_heading)
         self.path = [(0, 0)]
         self.objects = [] 
 
+        # Mission timeline; scrub is the TimelineState being viewed, None while live
+        self.timeline = Timeline(self.bot_x, self.bot_y, self.bot_heading, len(self.path))
+        self.scrub = None
+
         # Bounding Box for Dynamic Scaling (Min/Max values in CM)
         # Initializes a reasonable viewing window (1m x 1m)
         self.min_x = -50.0
@@ -39,15 +115,67 @@ class CyBotGUI:
         
         # Dynamic Scaling variables
         self.scale = 2.0 
-        self.grid_cm = 50 # Grid line every 50cm
+        self.grid_cm = 50 # Grid spacing in cm, adapted to zoom in draw_grid_layer
+        self.translate_x = 0.0
+        self.translate_y = 0.0
+
+        # Layered map cache (static layers are rebuilt when the viewport key changes)
+        self.viewport = None
+        self.path_drawn = 0
+        self.path_segments = 0
+        self.objects_drawn = 0
+
+        # Adaptive render quality
+        self.quality = 0
+        self.map_dirty = True
+        self.frame_cost_ms = 0.0
+        self.level_frames = 0   # Real draws since the last level change
+        self.level_costs = {}   # level -> averaged draw cost (ms) when we stepped down from it
+        self.entry_cost = None  # Settled draw cost at the current level, lowered as it gets cheaper
+        self.probe_frames = PROBE_FRAMES
+        self.probing = False    # Current level was entered by a step up that has not settled yet
+        self.skipped_frames = 0
 
         self.setup_ui()
         
-        self.log("System", "Initializing network thread...")
-        self.net_thread = threading.Thread(target=self.network_loop, daemon=True)
-        self.net_thread.start()
-        
+        if replay:
+            self.load_mission(replay)
+        elif split_mode:
+            # Imported on demand so the default in-process mode never loads multiprocessing
+            import telemetry_worker
+            self.log("Sys", "Starting telemetry worker process...")
+            self.rec = telemetry_worker
+            self.worker = telemetry_worker.TelemetryWorker(self.host, self.port)
+            self.worker.start()
+        else:
+            self.log("Sys", "Initializing network thread...")
+            self.net_thread = threading.Thread(target=self.network_loop, daemon=True)
+            self.net_thread.start()
+        
+        self.diagnostics = None
+        self.root.bind('<F12>', self.toggle_diagnostics)
+        if diagnostics:
+            self.toggle_diagnostics()
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.root.after(100, self.process_queue)
+        self.root.after(100, self.render_loop)
+        self.root.after(250, self.update_link_health)
+        self.root.after(LOG_REFRESH_MS, self.refresh_log)
+
+    def toggle_diagnostics(self, event=None):
+        # Profiler/tracemalloc panel is only loaded the first time it is opened
+        if self.diagnostics is None:
+            from diagnostics import Diagnostics
+            self.diagnostics = Diagnostics(self)
+        self.diagnostics.toggle()
+
+    def on_closing(self):
+        if self.diagnostics:
+            self.diagnostics.disable()
+        if self.worker:
+            self.worker.stop()
+        self.root.destroy()
 
     def setup_ui(self):
         main_frame = tk.Frame(self.root, bg="#2c3e50")
@@ -57,6 +185,22 @@ class CyBotGUI:
         self.canvas_frame = tk.Frame(main_frame, bg="black", bd=2, relief=tk.SUNKEN)
         self.canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Mission timeline scrub bar (packed first so it keeps its space below the map)
+        scrub_frame = tk.Frame(self.canvas_frame, bg="#2c3e50")
+        scrub_frame.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.scrub_scale = tk.Scale(scrub_frame, from_=0, to=SCRUB_STEPS, orient=tk.HORIZONTAL, showvalue=False,
+                                    bg="#2c3e50", troughcolor="#1a1a1a", highlightthickness=0,
+                                    command=self.on_scrub)
+        self.scrub_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        self.scrub_lbl = tk.Label(scrub_frame, text="LIVE", bg="#2c3e50", fg="#27ae60",
+                                font=("Consolas", 9), width=18)
+        self.scrub_lbl.pack(side=tk.LEFT)
+        self.scrub_scale.set(SCRUB_STEPS)
+        tk.Button(scrub_frame, text="LIVE", command=self.go_live).pack(side=tk.LEFT, padx=2)
+        tk.Button(scrub_frame, text="Save", command=self.save_mission).pack(side=tk.LEFT, padx=(0, 5))
+
         self.canvas = tk.Canvas(self.canvas_frame, bg="#1a1a1a", highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.canvas.bind("<Configure>", self.draw_map) 
@@ -66,6 +210,10 @@ class CyBotGUI:
                                  bg="#1a1a1a", fg="#00ff00", font=("Consolas", 10), anchor="w")
         self.info_label.place(x=10, y=10)
 
+        # Shown only while render quality is reduced
+        self.quality_label = tk.Label(self.canvas_frame, text="", bg="#1a1a1a", fg="#e67e22",
+                                    font=("Consolas", 10), anchor="e")
+
         # Right Panel (Controls & Logs)
         right_panel = tk.Frame(main_frame, width=300, bg="#34495e")
         right_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0))
@@ -76,6 +224,16 @@ class CyBotGUI:
                                  font=("Arial", 12, "bold"), pady=10)
         self.status_lbl.pack(fill=tk.X)
 
+        # Link Health (throughput / stalls / RTT)
+        health_frame = tk.Frame(right_panel, bg="#34495e")
+        health_frame.pack(fill=tk.X)
+
+        self.health_lbl = tk.Label(health_frame, text="LINK: --", bg=HEALTH_COLORS["DOWN"], fg="white",
+                                 font=("Consolas", 9), anchor="w", justify=tk.LEFT)
+        self.health_lbl.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        tk.Button(health_frame, text="Export", command=self.export_link_health).pack(side=tk.RIGHT)
+
         # Approval Section
         approval_frame = tk.LabelFrame(right_panel, text="Approvals", bg="#34495e", fg="white", pady=10)
         approval_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -118,9 +276,43 @@ class CyBotGUI:
         log_frame = tk.LabelFrame(right_panel, text="Telemetry Log", bg="#34495e", fg="white")
         log_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.log_area = scrolledtext.ScrolledText(log_frame, bg="#2c3e50", fg="#ecf0f1", 
-                                                font=("Consolas", 9), state='disabled')
-        self.log_area.pack(fill=tk.BOTH, expand=True)
+        filter_bar = tk.Frame(log_frame, bg="#34495e")
+        filter_bar.pack(fill=tk.X)
+
+        self.log_tag_var = tk.StringVar(value="All")
+        ttk.Combobox(filter_bar, textvariable=self.log_tag_var, values=LOG_TAGS,
+                     width=9, state="readonly").pack(side=tk.LEFT)
+
+        self.log_span_var = tk.StringVar(value="All time")
+        ttk.Combobox(filter_bar, textvariable=self.log_span_var, values=list(LOG_SPANS),
+                     width=7, state="readonly").pack(side=tk.LEFT, padx=2)
+
+        self.log_search_var = tk.StringVar()
+        tk.Entry(filter_bar, textvariable=self.log_search_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        for var in (self.log_tag_var, self.log_span_var, self.log_search_var):
+            var.trace_add("write", self.schedule_log_filter)
+
+        self.log_count_lbl = tk.Label(log_frame, text="0 entries", bg="#34495e", fg="#bdc3c7",
+                                    font=("Consolas", 8), anchor="w")
+        self.log_count_lbl.pack(fill=tk.X)
+
+        # Virtualized log: the Text only ever holds the visible page
+        log_body = tk.Frame(log_frame, bg="#34495e")
+        log_body.pack(fill=tk.BOTH, expand=True)
+
+        log_font = ("Consolas", 9)
+        self.log_line_px = tkfont.Font(font=log_font).metrics("linespace")
+        self.log_area = tk.Text(log_body, bg="#2c3e50", fg="#ecf0f1", font=log_font,
+                              wrap='none', state='disabled')
+        self.log_scroll = tk.Scrollbar(log_body, command=self.scroll_log)
+        self.log_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.log_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.log_area.bind("<Configure>", lambda e: self.render_log_page())
+        self.log_area.bind("<MouseWheel>", lambda e: self.scroll_log("scroll", -3 if e.delta > 0 else 3, "units"))
+        self.log_area.bind("<Button-4>", lambda e: self.scroll_log("scroll", -3, "units"))
+        self.log_area.bind("<Button-5>", lambda e: self.scroll_log("scroll", 3, "units"))
         
     def network_loop(self):
         while True:
@@ -128,29 +320,42 @@ class CyBotGUI:
                 self.msg_queue.put(("STATUS", "CONNECTING..."))
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.socket.settimeout(5)
-                self.socket.connect((CYBOT_IP, CYBOT_PORT))
+                self.socket.connect((self.host, self.port))
                 
                 self.msg_queue.put(("STATUS", "CONNECTED"))
                 self.connected = True
+                self.link.on_connected(True)
                 
                 while True:
                     data = self.socket.recv(1024)
                     if not data: break
+                    # Timestamp on arrival, before the GUI queue adds its own delay
+                    t = time.monotonic()
+                    self.link.on_chunk(t, len(data))
                     text = data.decode('utf-8', errors='ignore').strip()
                     for line in text.split('\n'):
                         if line:
+                            self.link.on_message(line.strip(), t)
                             self.msg_queue.put(("DATA", line.strip()))
                             
             except Exception as e:
+                self.link.on_connected(False)
                 self.msg_queue.put(("LOG", f"Connection Error: {e}"))
                 self.msg_queue.put(("STATUS", "DISCONNECTED"))
                 self.connected = False
                 time.sleep(3) 
 
     def send_command(self, char):
+        if self.worker:
+            if self.connected:
+                self.worker.send(char)
+                self.link.on_command(char, time.monotonic())
+                self.log("CMD", f"Sent: {char}")
+            return
         if self.connected and self.socket:
             try:
                 self.socket.sendall(char.encode('utf-8'))
+                self.link.on_command(char, time.monotonic())
                 self.log("CMD", f"Sent: {char}")
             except:
                 self.log("Error", "Failed to send command")
@@ -161,14 +366,36 @@ class CyBotGUI:
         self.btn_yes.config(state=tk.DISABLED)
         self.btn_no.config(state=tk.DISABLED)
 
+    def set_status(self, content):
+        color = "#27ae60" if content == "CONNECTED" else "#c0392b"
+        self.status_lbl.config(text=content, bg=color)
+
+    def show_request(self, message):
+        self.log("REQ", message)
+        self.req_label.config(text=message, fg="#f1c40f")
+        self.btn_yes.config(state=tk.NORMAL)
+        self.btn_no.config(state=tk.NORMAL)
+        self.root.bell()
+
     def process_queue(self):
+        delay = 50
         try:
+            if self.worker:
+                if self.process_worker_records():
+                    delay = 1
+                return
+
+            deadline = time.perf_counter() + QUEUE_BUDGET_S
             while True:
+                if time.perf_counter() > deadline:
+                    # Backlog left; yield to Tk so input events are handled, then continue
+                    delay = 1
+                    break
+
                 msg_type, content = self.msg_queue.get_nowait()
                 
                 if msg_type == "STATUS":
-                    color = "#27ae60" if content == "CONNECTED" else "#c0392b"
-                    self.status_lbl.config(text=content, bg=color)
+                    self.set_status(content)
                 
                 elif msg_type == "LOG":
                     self.log("Sys", content)
@@ -179,7 +406,72 @@ class CyBotGUI:
         except queue.Empty:
             pass
         finally:
-            self.root.after(50, self.process_queue)
+            self.root.after(delay, self.process_queue)
+
+    def update_link_health(self):
+        try:
+            h = self.link.evaluate()
+            rtt = f"{h['rtt_ms']:.0f}ms" if h['rtt_ms'] is not None else "--"
+            self.health_lbl.config(
+                text=f"LINK: {h['state']}  {h['bytes_per_s']:.0f} B/s  {h['msgs_per_s']:.1f} msg/s  RTT {rtt}",
+                bg=HEALTH_COLORS[h['state']])
+        finally:
+            self.root.after(250, self.update_link_health)
+
+    def export_link_health(self):
+        path = self.link.export()
+        self.log("Sys", f"Link health written to {path}")
+
+    def process_worker_records(self):
+        # Worker already parsed and dead-reckoned; apply results and redraw once per batch
+        rec = self.rec
+        records = self.worker.poll(WORKER_BATCH)
+        for kind, a, b, c, text in records:
+            if kind == rec.REC_STATUS:
+                self.connected = text == "CONNECTED"
+                self.link.on_connected(self.connected)
+                self.set_status(text)
+
+            elif kind == rec.REC_LOG:
+                self.log("Sys", text)
+
+            elif kind == rec.REC_CHUNK:
+                # a = worker's monotonic receive time, b = bytes
+                self.link.on_chunk(a, int(b))
+                self.last_chunk_t = a
+
+            elif kind == rec.REC_RX:
+                self.link.on_message(text, self.last_chunk_t or time.monotonic())
+                self.log("RX", text)
+
+            elif kind == rec.REC_POSE:
+                self.bot_x, self.bot_y, self.bot_heading = a, b, c
+                self.path.append((a, b))
+                self.timeline.record_pose(time.time(), a, b, c)
+                self.extend_bounds(a, b)
+                self.request_redraw()
+
+            elif kind == rec.REC_OBJ:
+                self.objects.append((a, b))
+                self.timeline.record_object(time.time(), a, b)
+                self.extend_bounds(a, b)
+                self.request_redraw()
+
+            elif kind == rec.REC_REQ:
+                self.show_request(text)
+
+            elif kind == rec.REC_PARSE_ERR:
+                self.log("Parse Error", text)
+
+            elif kind == rec.REC_SEND_ERR:
+                self.log("Error", text)
+
+        if self.worker.dropped != self.dropped_reported:
+            self.log("Sys", f"Telemetry ring overrun: {self.worker.dropped - self.dropped_reported} records dropped")
+            self.dropped_reported = self.worker.dropped
+
+        # A full batch means more records are probably waiting
+        return len(records) == WORKER_BATCH
 
     def parse_telemetry(self, raw_str):
         self.log("RX", raw_str)
@@ -203,59 +495,121 @@ class CyBotGUI:
                 
             elif cmd == "REQ":
                 message = parts[1] if len(parts) > 1 else "Action required?"
-                self.req_label.config(text=message, fg="#f1c40f")
-                self.btn_yes.config(state=tk.NORMAL)
-                self.btn_no.config(state=tk.NORMAL)
-                self.root.bell()
+                self.show_request(message)
 
         except Exception as e:
             self.log("Parse Error", f"{e} in data: {raw_str}")
 
     def update_position(self, move_dist, turn_angle):
-        
-        # 1. Update Heading
-        self.bot_heading = (self.bot_heading + turn_angle) % 360
-        
-        # 2. Update Position
-        rad = math.radians(self.bot_heading)
-        
-        dx = math.cos(rad) * move_dist
-        dy = math.sin(rad) * move_dist
-        
-        self.bot_x += dx
-        self.bot_y += dy
+        # 1. Update heading and position (shared with the split-mode worker)
+        self.bot_x, self.bot_y, self.bot_heading = self.reckoner.update_position(move_dist, turn_angle)
         
         self.path.append((self.bot_x, self.bot_y))
+        self.timeline.record_pose(time.time(), self.bot_x, self.bot_y, self.bot_heading)
 
-        # 3. Update Bounding Box for dynamic map
-        self.min_x = min(self.min_x, self.bot_x)
-        self.max_x = max(self.max_x, self.bot_x)
-        self.min_y = min(self.min_y, self.bot_y)
-        self.max_y = max(self.max_y, self.bot_y)
+        # 2. Update Bounding Box for dynamic map
+        self.extend_bounds(self.bot_x, self.bot_y)
         
-        self.draw_map()
+        self.request_redraw()
 
     def add_object(self, scan_angle, dist):
-        # Calculate absolute angle of object
-        abs_angle_rad = math.radians(self.bot_heading + scan_angle)
-        
-        obj_x = self.bot_x + (math.cos(abs_angle_rad) * dist)
-        obj_y = self.bot_y + (math.sin(abs_angle_rad) * dist)
+        obj_x, obj_y = self.reckoner.locate_object(scan_angle, dist)
         
         self.objects.append((obj_x, obj_y))
+        self.timeline.record_object(time.time(), obj_x, obj_y)
         
         # Update Bounding Box for objects too
-        self.min_x = min(self.min_x, obj_x)
-        self.max_x = max(self.max_x, obj_x)
-        self.min_y = min(self.min_y, obj_y)
-        self.max_y = max(self.max_y, obj_y)
+        self.extend_bounds(obj_x, obj_y)
         
-        self.draw_map()
+        self.request_redraw()
+
+    def extend_bounds(self, x, y):
+        self.min_x = min(self.min_x, x)
+        self.max_x = max(self.max_x, x)
+        self.min_y = min(self.min_y, y)
+        self.max_y = max(self.max_y, y)
 
-    # --- Drawing Engine (Dynamic) ---
+    # --- Render Loop (Adaptive Quality) ---
+    def request_redraw(self):
+        # Updates only mark the map dirty; render_loop draws at most once per frame
+        if self.map_dirty:
+            self.skipped_frames += 1
+        self.map_dirty = True
+
+    def render_loop(self):
+        level = QUALITY_LEVELS[self.quality]
+        try:
+            if self.map_dirty:
+                self.map_dirty = False
+                start = time.perf_counter()
+                self.draw_map()
+                cost = (time.perf_counter() - start) * 1000
+                self.adapt_quality(cost)
+        finally:
+            self.root.after(level["frame_ms"], self.render_loop)
+
+    def adapt_quality(self, cost):
+        # Only real draws get here; idle frames say nothing about what full detail costs
+        self.frame_cost_ms = 0.8 * self.frame_cost_ms + 0.2 * cost
+        self.level_frames += 1
+
+        if self.frame_cost_ms > FRAME_BUDGET_MS and self.quality < len(QUALITY_LEVELS) - 1:
+            if self.probing:
+                # A step up that went straight back over budget waits longer next time
+                self.probe_frames = min(self.probe_frames * 2, PROBE_MAX_FRAMES)
+            self.level_costs[self.quality] = self.frame_cost_ms
+            self.set_quality(self.quality + 1)
+            return
+
+        if self.level_frames < RECOVER_FRAMES:
+            return
+        if self.probing:
+            self.probing = False
+            self.probe_frames = PROBE_FRAMES
+        if self.quality == 0:
+            return
+        if self.entry_cost is None:
+            self.entry_cost = max(self.frame_cost_ms, 0.01)
+            return
+
+        # Drawing got cheaper since we settled here: the higher levels will have too
+        if self.frame_cost_ms < self.entry_cost:
+            ratio = self.frame_cost_ms / self.entry_cost
+            for level in range(self.quality):
+                if level in self.level_costs:
+                    self.level_costs[level] *= ratio
+            self.entry_cost = max(self.frame_cost_ms, 0.01)
+
+        # Step up when the predicted cost fits, or probe one level up after a
+        # while well under budget in case the load dropped before we settled
+        predicted = self.level_costs.get(self.quality - 1, FRAME_BUDGET_MS)
+        if predicted < FRAME_BUDGET_MS * 0.8 or (
+                self.frame_cost_ms < FRAME_BUDGET_MS * 0.5 and self.level_frames >= self.probe_frames):
+            self.set_quality(self.quality - 1)
+            self.probing = True
+
+    def set_quality(self, level):
+        self.quality = level
+        self.level_frames = 0
+        self.entry_cost = None
+        self.probing = False
+        # Start the average over at the new level so one change settles before the next
+        self.frame_cost_ms = FRAME_BUDGET_MS * 0.5
+        self.map_dirty = True
+        self.viewport = None
+
+    def update_quality_label(self):
+        if self.quality == 0:
+            self.quality_label.place_forget()
+            return
+        self.quality_label.config(text=f"DEGRADED L{self.quality}  skipped: {self.skipped_frames}")
+        self.quality_label.place(relx=1.0, x=-10, y=10, anchor="ne")
+
+    # --- Drawing Engine (Layered) ---
+    # Static layers (background, grid, axis labels, path/object history) are only
+    # rebuilt when the viewport changes. Other frames append the newest path
+    # points and objects and redraw the robot.
     def draw_map(self, event=None):
-        self.canvas.delete("all")
-        
         w = self.canvas.winfo_width()
         h = self.canvas.winfo_height()
         
@@ -274,51 +628,117 @@ class CyBotGUI:
         center_x_cm = (self.min_x + self.max_x) / 2
         center_y_cm = (self.min_y + self.max_y) / 2
         
-        translate_x = w / 2 - center_x_cm * self.scale
-        translate_y = h / 2 + center_y_cm * self.scale 
+        self.translate_x = w / 2 - center_x_cm * self.scale
+        self.translate_y = h / 2 + center_y_cm * self.scale 
+
+        level = QUALITY_LEVELS[self.quality]
+
+        # While scrubbing, show the timeline state instead of the live one
+        # (the scale above still covers the whole mission so the map doesn't jump)
+        if self.scrub:
+            path_len, objects_len = self.scrub.path_len, self.scrub.objects_len
+            x, y, heading = self.scrub.x, self.scrub.y, self.scrub.heading
+        else:
+            path_len, objects_len = len(self.path), len(self.objects)
+            x, y, heading = self.bot_x, self.bot_y, self.bot_heading
+
+        # 2. Static layers: rebuild only on resize, rescale or quality change
+        viewport = (w, h, self.scale, self.translate_x, self.translate_y, self.quality)
+        if viewport != self.viewport:
+            self.viewport = viewport
+            self.canvas.delete("all")
+            self.draw_grid_layer(w, h, level)
+            self.draw_path_layer(level, path_len)
+            self.draw_object_layer(level, objects_len)
+        else:
+            self.update_history(level, path_len, objects_len)
+
+        # 3. Dynamic layer: robot
+        self.draw_robot(x, y, heading)
+        
+        # Update Label
+        self.info_label.config(text=f"X: {x:.1f} cm  Y: {y:.1f} cm  H: {heading:.1f}°")
+        self.update_quality_label()
+
+    # Coordinate Transform (World -> Screen): scale, invert Y, and apply translation
+    def to_screen(self, x, y):
+        return x * self.scale + self.translate_x, self.translate_y - y * self.scale
 
-        # Coordinate Transform Function (World -> Screen)
-        def to_screen(x, y):
-            # Scale, invert Y, and apply translation
-            sx = x * self.scale + translate_x
-            sy = h - (y * self.scale + (h - translate_y)) 
-            return sx, sy
+    def draw_grid_layer(self, w, h, level):
+        label_every = level["labels"]
+        self.grid_cm = grid_spacing(self.scale)
+        g = self.grid_cm
 
-        # 2. Draw Dynamic Grid
-        self.canvas.create_rectangle(0, 0, w, h, fill="#1a1a1a") 
+        self.canvas.create_rectangle(0, 0, w, h, fill="#1a1a1a", tags="bg") 
 
+        # Only lines that are actually on screen; spacing keeps the count bounded
         # Draw vertical grid lines
-        start_cm_x = self.min_x - (self.min_x % self.grid_cm) - self.grid_cm
-        end_cm_x = self.max_x + self.grid_cm
-        for x_cm in range(int(start_cm_x), int(end_cm_x), self.grid_cm):
-            sx, _ = to_screen(x_cm, 0)
-            self.canvas.create_line(sx, 0, sx, h, fill="#34495e", dash=(2, 4))
-            self.canvas.create_text(sx, h - 10, text=f"{x_cm}cm", fill="#607d8b", anchor="s")
+        left_cm = -self.translate_x / self.scale
+        right_cm = (w - self.translate_x) / self.scale
+        for x_cm in range(math.floor(left_cm / g) * g, int(right_cm) + g, g):
+            sx, _ = self.to_screen(x_cm, 0)
+            self.canvas.create_line(sx, 0, sx, h, fill="#34495e", dash=(2, 4), tags="grid")
+            if label_every and (x_cm // g) % label_every == 0:
+                self.canvas.create_text(sx, h - 10, text=f"{x_cm}cm", fill="#607d8b", anchor="s", tags="grid")
 
         # Draw horizontal grid lines
-        start_cm_y = self.min_y - (self.min_y % self.grid_cm) - self.grid_cm
-        end_cm_y = self.max_y + self.grid_cm
-        for y_cm in range(int(start_cm_y), int(end_cm_y), self.grid_cm):
-            _, sy = to_screen(0, y_cm)
-            self.canvas.create_line(0, sy, w, sy, fill="#34495e", dash=(2, 4))
-            self.canvas.create_text(10, sy + 5, text=f"{y_cm}cm", fill="#607d8b", anchor="w")
-            
-        # 3. Draw Path
-        if len(self.path) > 1:
-            screen_coords = [to_screen(x, y) for x, y in self.path]
-            flat_coords = [val for pair in screen_coords for val in pair]
-            self.canvas.create_line(flat_coords, fill="#27ae60", width=2)
-
-        # 4. Draw Objects
-        for ox, oy in self.objects:
-            sx, sy = to_screen(ox, oy)
-            self.canvas.create_oval(sx-4, sy-4, sx+4, sy+4, fill="#c0392b", outline="")
-
-        # 5. Draw Robot
-        bx, by = to_screen(self.bot_x, self.bot_y)
+        bottom_cm = (self.translate_y - h) / self.scale
+        top_cm = self.translate_y / self.scale
+        for y_cm in range(math.floor(bottom_cm / g) * g, int(top_cm) + g, g):
+            _, sy = self.to_screen(0, y_cm)
+            self.canvas.create_line(0, sy, w, sy, fill="#34495e", dash=(2, 4), tags="grid")
+            if label_every and (y_cm // g) % label_every == 0:
+                self.canvas.create_text(10, sy + 5, text=f"{y_cm}cm", fill="#607d8b", anchor="w", tags="grid")
+
+    def draw_path_layer(self, level, path_len):
+        # Whole path history as one line (decimated at reduced quality, newest point always kept)
+        self.canvas.delete("path")
+        self.path_segments = 0
+        self.path_drawn = path_len
+        path = decimate(self.path[:path_len], level["max_path"])
+        if len(path) > 1:
+            self.add_path_line(path)
+
+    def draw_object_layer(self, level, objects_len):
+        self.canvas.delete("objects")
+        self.objects_drawn = objects_len
+        for ox, oy in decimate(self.objects[:objects_len], level["max_objects"]):
+            self.add_object_dot(ox, oy)
+
+    def update_history(self, level, path_len, objects_len):
+        # Moving forward appends; scrubbing backwards rebuilds the history layer
+        if path_len < self.path_drawn or self.path_segments >= PATH_SEGMENT_LIMIT:
+            # (also folds the per-frame segments back into one history line)
+            self.draw_path_layer(level, path_len)
+        elif path_len > self.path_drawn:
+            self.add_path_line(self.path[self.path_drawn - 1:path_len])
+            self.path_drawn = path_len
+
+        if objects_len < self.objects_drawn:
+            self.draw_object_layer(level, objects_len)
+        else:
+            for ox, oy in self.objects[self.objects_drawn:objects_len]:
+                self.add_object_dot(ox, oy)
+            self.objects_drawn = objects_len
+
+    def add_path_line(self, points):
+        flat_coords = [val for x, y in points for val in self.to_screen(x, y)]
+        item = self.canvas.create_line(flat_coords, fill="#27ae60", width=2, tags="path")
+        # Keep the path underneath the object markers
+        if self.objects_drawn:
+            self.canvas.tag_lower(item, "objects")
+        self.path_segments += 1
+
+    def add_object_dot(self, ox, oy):
+        sx, sy = self.to_screen(ox, oy)
+        self.canvas.create_oval(sx-4, sy-4, sx+4, sy+4, fill="#c0392b", outline="", tags="objects")
+
+    def draw_robot(self, x, y, heading):
+        self.canvas.delete("robot")
+        bx, by = self.to_screen(x, y)
         
         # Robot Body (Triangle)
-        head_rad = math.radians(self.bot_heading)
+        head_rad = math.radians(heading)
         tri_size = 10 
         
         nx = bx + math.cos(head_rad) * tri_size
@@ -330,17 +750,119 @@ class CyBotGUI:
         brx = bx + math.cos(head_rad - 2.5) * tri_size * 0.8
         bry = by - math.sin(head_rad - 2.5) * tri_size * 0.8
         
-        self.canvas.create_polygon(nx, ny, blx, bly, brx, bry, fill="#3498db", outline="white")
-        
-        # Update Label
-        self.info_label.config(text=f"X: {self.bot_x:.1f} cm  Y: {self.bot_y:.1f} cm  H: {self.bot_heading:.1f}°")
-
+        self.canvas.create_polygon(nx, ny, blx, bly, brx, bry, fill="#3498db", outline="white", tags="robot")
+
+    # --- Mission Timeline (Scrubbing) ---
+    def on_scrub(self, value):
+        timeline = self.timeline
+        if int(value) >= SCRUB_STEPS or not len(timeline):
+            self.go_live()
+            return
+        t = timeline.start + (timeline.end - timeline.start) * int(value) / SCRUB_STEPS
+        self.scrub = timeline.state_at(t)
+        behind = timeline.end - t
+        self.scrub_lbl.config(text=f"{time.strftime('%H:%M:%S', time.localtime(t))} -{behind:.0f}s",
+                              fg="#f39c12")
+        self.map_dirty = True
+
+    def go_live(self):
+        self.scrub = None
+        self.scrub_lbl.config(text="LIVE", fg="#27ae60")
+        if self.scrub_scale.get() != SCRUB_STEPS:
+            self.scrub_scale.set(SCRUB_STEPS)
+        self.map_dirty = True
+
+    def save_mission(self):
+        path = time.strftime("cybot_mission_%Y%m%d_%H%M%S.json")
+        self.timeline.save(path)
+        self.log("Sys", f"Mission timeline written to {path}")
+
+    def load_mission(self, path):
+        # Recorded mission: rebuild path/objects from the timeline, no connection
+        self.timeline = Timeline.load(path)
+        for kind, x, y, heading in self.timeline.events:
+            if kind == EV_POSE:
+                self.bot_x, self.bot_y, self.bot_heading = x, y, heading
+                self.path.append((x, y))
+            else:
+                self.objects.append((x, y))
+            self.extend_bounds(x, y)
+        self.reckoner = DeadReckoner(self.bot_x, self.bot_y, self.bot_heading)
+        self.set_status("REPLAY")
+        self.log("Sys", f"Loaded mission {path}: {len(self.timeline)} events")
+        self.map_dirty = True
+
+    # --- Telemetry Log (Indexed Store + Virtualized View) ---
     def log(self, tag, msg):
+        self.log_store.append(tag, msg)
+        self.log_dirty = True
+
+    def refresh_log(self):
+        try:
+            # Rolling time spans move even when nothing new is logged
+            if self.log_dirty or self.log_view.span:
+                self.log_dirty = False
+                self.log_view.refresh()
+                self.render_log_page()
+        finally:
+            self.root.after(LOG_REFRESH_MS, self.refresh_log)
+
+    def log_rows(self):
+        # Usable height excludes the Text widget's border, focus ring and padding
+        area = self.log_area
+        inset = sum(int(str(area.cget(opt))) for opt in ("borderwidth", "highlightthickness", "pady"))
+        return max(1, (area.winfo_height() - 2 * inset) // self.log_line_px)
+
+    def render_log_page(self):
+        rows = self.log_rows()
+        total = len(self.log_view)
+        if self.log_follow:
+            self.log_top = total - rows
+        self.log_top = max(0, min(self.log_top, total - rows))
+
+        store = self.log_store
+        lines = [store.format(i) for i in self.log_view.page(self.log_top, rows)]
+
         self.log_area.configure(state='normal')
-        self.log_area.insert(tk.END, f"[{tag}] {msg}\n")
-        self.log_area.see(tk.END)
+        self.log_area.delete("1.0", tk.END)
+        self.log_area.insert(tk.END, "\n".join(lines))
         self.log_area.configure(state='disabled')
 
+        if total:
+            self.log_scroll.set(self.log_top / total, min(1.0, (self.log_top + rows) / total))
+        else:
+            self.log_scroll.set(0, 1)
+        self.log_count_lbl.config(text=f"{total} of {len(store)} entries")
+
+    def scroll_log(self, *args):
+        rows = self.log_rows()
+        total = len(self.log_view)
+        if args[0] == "moveto":
+            self.log_top = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = rows if args[2] == "pages" else 1
+            self.log_top += int(args[1]) * step
+        self.log_top = max(0, min(self.log_top, total - rows))
+        # Scrolling back to the bottom resumes following new entries
+        self.log_follow = self.log_top >= total - rows
+        self.render_log_page()
+        return "break"
+
+    def schedule_log_filter(self, *args):
+        # Debounced so each keystroke in the search box doesn't trigger a rescan
+        if self.log_filter_job:
+            self.root.after_cancel(self.log_filter_job)
+        self.log_filter_job = self.root.after(150, self.apply_log_filter)
+
+    def apply_log_filter(self):
+        self.log_filter_job = None
+        tag = self.log_tag_var.get()
+        self.log_view = LogView(self.log_store, tag=None if tag == "All" else tag,
+                                text=self.log_search_var.get(), span=LOG_SPANS[self.log_span_var.get()],
+                                base=self.log_view)
+        self.log_follow = True
+        self.render_log_page()
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = CyBotGUI(root)
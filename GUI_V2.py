@@ -86,73 +86,80 @@ def on_closing():
     window.destroy()
 
 
-# Setup for main window
-window = tk.Tk()
-window.title("CyBot Control & PING Sensor")
-window.geometry("400x500")
+def build_window(host="192.168.1.1", port=288):
+    global window, dist_var, cycle_var, overflow_var, status_var, host_entry, port_entry
 
-# StringVars to hold the dynamic data being sent
-dist_var = tk.StringVar(value="-- cm")
-cycle_var = tk.StringVar(value="-- ticks")
-overflow_var = tk.StringVar(value="-- overflows")
-status_var = tk.StringVar(value="Not Connected")
+    # Setup for main window
+    window = tk.Tk()
+    window.title("CyBot Control & PING Sensor")
+    window.geometry("400x500")
 
-# Connection details
-conn_frame = tk.Frame(window)
+    # StringVars to hold the dynamic data being sent
+    dist_var = tk.StringVar(value="-- cm")
+    cycle_var = tk.StringVar(value="-- ticks")
+    overflow_var = tk.StringVar(value="-- overflows")
+    status_var = tk.StringVar(value="Not Connected")
 
-tk.Label(conn_frame, text="Host:").pack(side=tk.LEFT, padx=5)
-host_entry = tk.Entry(conn_frame)
-host_entry.insert(0, "192.168.1.1")
-host_entry.pack(side=tk.LEFT)
+    # Connection details
+    conn_frame = tk.Frame(window)
 
-tk.Label(conn_frame, text="Port:").pack(side=tk.LEFT, padx=5)
-port_entry = tk.Entry(conn_frame)
-port_entry.insert(0, "288")
-port_entry.pack(side=tk.LEFT)
-conn_frame.pack(pady=5)
+    tk.Label(conn_frame, text="Host:").pack(side=tk.LEFT, padx=5)
+    host_entry = tk.Entry(conn_frame)
+    host_entry.insert(0, host)
+    host_entry.pack(side=tk.LEFT)
 
+    tk.Label(conn_frame, text="Port:").pack(side=tk.LEFT, padx=5)
+    port_entry = tk.Entry(conn_frame)
+    port_entry.insert(0, str(port))
+    port_entry.pack(side=tk.LEFT)
+    conn_frame.pack(pady=5)
 
-connect_button = tk.Button(window, text="Connect", command=start_listener_thread)
-connect_button.pack(pady=5)
 
-scan_button = tk.Button(window, text="Scan (m)", command=lambda: send_command('m'))
-scan_button.pack(pady=5)
+    connect_button = tk.Button(window, text="Connect", command=start_listener_thread)
+    connect_button.pack(pady=5)
 
-status_label = tk.Label(window, textvariable=status_var)
-status_label.pack(pady=5)
+    scan_button = tk.Button(window, text="Scan (m)", command=lambda: send_command('m'))
+    scan_button.pack(pady=5)
 
-move_frame = tk.Frame(window)
-move_frame.pack(pady=10)
+    status_label = tk.Label(window, textvariable=status_var)
+    status_label.pack(pady=5)
 
-tk.Label(move_frame, text="Movement Controls", font=("Helvetica", 14)).grid(row=0, column=0, columnspan=3, pady=5)
+    move_frame = tk.Frame(window)
+    move_frame.pack(pady=10)
 
-fwd_button = tk.Button(move_frame, text="Forward (w)", command=lambda: send_command('w'))
-fwd_button.grid(row=1, column=1)
+    tk.Label(move_frame, text="Movement Controls", font=("Helvetica", 14)).grid(row=0, column=0, columnspan=3, pady=5)
 
-left_button = tk.Button(move_frame, text="Left (a)", command=lambda: send_command('a'))
-left_button.grid(row=2, column=0, padx=5)
+    fwd_button = tk.Button(move_frame, text="Forward (w)", command=lambda: send_command('w'))
+    fwd_button.grid(row=1, column=1)
 
-back_button = tk.Button(move_frame, text="Backward (s)", command=lambda: send_command('s'))
-back_button.grid(row=2, column=1)
+    left_button = tk.Button(move_frame, text="Left (a)", command=lambda: send_command('a'))
+    left_button.grid(row=2, column=0, padx=5)
 
-right_button = tk.Button(move_frame, text="Right (d)", command=lambda: send_command('d'))
-right_button.grid(row=2, column=2, padx=5)
+    back_button = tk.Button(move_frame, text="Backward (s)", command=lambda: send_command('s'))
+    back_button.grid(row=2, column=1)
 
+    right_button = tk.Button(move_frame, text="Right (d)", command=lambda: send_command('d'))
+    right_button.grid(row=2, column=2, padx=5)
 
-data_frame = tk.Frame(window)
-data_frame.pack(pady=10)
 
-tk.Label(data_frame, text="Distance:", font=("Helvetica", 14)).pack(pady=(10, 0))
-tk.Label(data_frame, textvariable=dist_var, font=("Helvetica", 12,)).pack()
+    data_frame = tk.Frame(window)
+    data_frame.pack(pady=10)
 
-tk.Label(data_frame, text="Pulse Width:", font=("Helvetica", 14)).pack(pady=(10, 0))
-tk.Label(data_frame, textvariable=cycle_var, font=("Helvetica", 12,)).pack()
+    tk.Label(data_frame, text="Distance:", font=("Helvetica", 14)).pack(pady=(10, 0))
+    tk.Label(data_frame, textvariable=dist_var, font=("Helvetica", 12,)).pack()
 
-tk.Label(data_frame, text="Overflows:", font=("Helvetica", 14)).pack(pady=(10, 0))
-tk.Label(data_frame, textvariable=overflow_var, font=("Helvetica", 12,)).pack()
+    tk.Label(data_frame, text="Pulse Width:", font=("Helvetica", 14)).pack(pady=(10, 0))
+    tk.Label(data_frame, textvariable=cycle_var, font=("Helvetica", 12,)).pack()
 
-#Bind keypresses to the main window
-window.bind("<Key>", on_key_press)
+    tk.Label(data_frame, text="Overflows:", font=("Helvetica", 14)).pack(pady=(10, 0))
+    tk.Label(data_frame, textvariable=overflow_var, font=("Helvetica", 12,)).pack()
 
-window.protocol("WM_DELETE_WINDOW", on_closing)
-window.mainloop()
+    #Bind keypresses to the main window
+    window.bind("<Key>", on_key_press)
+    window.protocol("WM_DELETE_WINDOW", on_closing)
+
+    return window
+
+
+if __name__ == "__main__":
+    build_window().mainloop()
@@ -0,0 +1,120 @@
+import argparse
+import json
+import multiprocessing
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+# --- Split Mode Benchmark ---
+# Floods a fake CyBot with MOV/TURN/OBJ telemetry and measures how late the Tk
+# event loop runs a 16ms "frame" timer, with parsing in-process vs in the worker.
+# Needs a display (use xvfb-run on a headless box).
+
+FRAME_MS = 16
+WARMUP_S = 1.0
+
+
+def fake_cybot(port_queue, rate):
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", 0))
+    server.listen(4)
+    port_queue.put(server.getsockname()[1])
+
+    batch = 20
+    interval = batch / rate
+    while True:
+        conn, _ = server.accept()
+        i = 0
+        try:
+            while True:
+                lines = []
+                for _ in range(batch):
+                    if i % 3 == 0:
+                        lines.append("MOV,5.0")
+                    elif i % 3 == 1:
+                        lines.append("TURN,3.5")
+                    else:
+                        lines.append(f"OBJ,{(i * 7) % 180 - 90},{40 + i % 60}")
+                    i += 1
+                conn.sendall(("\n".join(lines) + "\n").encode('utf-8'))
+                time.sleep(interval)
+        except OSError:
+            conn.close()
+
+
+def run_mode(mode, port, seconds):
+    import tkinter as tk
+    from GUI4 import CyBotGUI
+
+    root = tk.Tk()
+    app = CyBotGUI(root, host="127.0.0.1", port=port, split_mode=(mode == "split"))
+    stamps = []
+    start = time.perf_counter()
+
+    def tick():
+        now = time.perf_counter()
+        if now - start > WARMUP_S:
+            stamps.append(now)
+        if now - start > WARMUP_S + seconds:
+            if app.worker:
+                app.worker.stop()
+            root.quit()
+            return
+        root.after(FRAME_MS, tick)
+
+    root.after(FRAME_MS, tick)
+    root.mainloop()
+
+    frames = [(b - a) * 1000 for a, b in zip(stamps, stamps[1:])]
+    frames.sort()
+    result = {
+        "mode": mode,
+        "frames": len(frames),
+        "mean_ms": statistics.mean(frames),
+        "jitter_ms": statistics.pstdev(frames),
+        "p95_ms": frames[int(len(frames) * 0.95)],
+        "p99_ms": frames[int(len(frames) * 0.99)],
+        "max_ms": frames[-1],
+        "path_points": len(app.path),
+    }
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare UI frame jitter: in-process vs split telemetry")
+    parser.add_argument("--rate", type=float, default=2000, help="telemetry lines per second")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--run", choices=["inproc", "split"], help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_mode(args.run, args.port, args.seconds)
+        return
+
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(target=fake_cybot, args=(port_queue, args.rate), daemon=True)
+    server.start()
+    port = port_queue.get()
+
+    results = []
+    for mode in ("inproc", "split"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--run", mode, "--port", str(port), "--seconds", str(args.seconds)],
+            capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    server.terminate()
+
+    print(f"Target frame: {FRAME_MS}ms, telemetry: {args.rate:.0f} lines/s, {args.seconds:.0f}s per mode")
+    print(f"{'mode':<8}{'frames':>8}{'mean':>9}{'jitter':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for r in results:
+        print(f"{r['mode']:<8}{r['frames']:>8}{r['mean_ms']:>9.1f}{r['jitter_ms']:>9.1f}"
+              f"{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['max_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
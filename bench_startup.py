@@ -0,0 +1,78 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# --- Startup Benchmark ---
+# Launches cybot.py in each mode and times spawn -> first drawn window.
+# Use --record to append results to a history file and compare with the last run.
+# Needs a display (use xvfb-run on a headless box).
+
+LAUNCHER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cybot.py")
+HISTORY_FILE = "startup_history.jsonl"
+
+
+def time_mode(mode, runs):
+    wall, in_process = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, LAUNCHER, f"--{mode}", "--host", "127.0.0.1", "--startup-probe"],
+            stdout=subprocess.PIPE, text=True)
+        for line in proc.stdout:
+            if line.startswith("READY"):
+                wall.append(time.perf_counter() - start)
+                in_process.append(float(line.split()[1]))
+                break
+        proc.wait()
+        if proc.returncode:
+            raise RuntimeError(f"{mode} mode exited with code {proc.returncode}")
+    return {
+        "wall_ms": statistics.median(wall) * 1000,
+        "in_process_ms": statistics.median(in_process) * 1000,
+    }
+
+
+def last_recorded(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        lines = [line for line in f if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure time to first usable window per mode")
+    parser.add_argument("--modes", nargs="+", default=["ping", "map", "login"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--record", nargs="?", const=HISTORY_FILE,
+                        help=f"append results to a history file (default {HISTORY_FILE})")
+    args = parser.parse_args()
+
+    results = {}
+    for mode in args.modes:
+        try:
+            results[mode] = time_mode(mode, args.runs)
+        except RuntimeError as e:
+            print(f"{mode}: {e}")
+
+    previous = last_recorded(args.record) if args.record else None
+
+    print(f"Median of {args.runs} runs")
+    print(f"{'mode':<8}{'wall ms':>10}{'in-proc ms':>12}{'vs last':>10}")
+    for mode, r in results.items():
+        delta = ""
+        if previous and mode in previous["results"]:
+            delta = f"{r['wall_ms'] - previous['results'][mode]['wall_ms']:+.1f}"
+        print(f"{mode:<8}{r['wall_ms']:>10.1f}{r['in_process_ms']:>12.1f}{delta:>10}")
+
+    if args.record:
+        with open(args.record, "a") as f:
+            f.write(json.dumps({"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import sys
+import time
+
+# --- CyBot Launcher ---
+# Single entry point for all dashboards. Only the chosen mode's module (and its
+# heavy dependencies, e.g. customtkinter for the login shell) is imported.
+#
+#   --ping   GUI_V2.py  PING sensor readout
+#   --map    GUI4.py    mission control map (replaces GUI_V3.py, an earlier
+#                       fixed-scale version of the same map that is kept only
+#                       for reference and has no launcher mode)
+#   --login  GUI.py     login shell
+
+START = time.perf_counter()
+
+DEFAULT_HOST = "192.168.1.1"
+DEFAULT_PORT = 288
+
+
+def open_ping(args):
+    import GUI_V2
+    return GUI_V2.build_window(args.host, args.port)
+
+
+def open_map(args):
+    import tkinter as tk
+    from GUI4 import CyBotGUI
+    root = tk.Tk()
+    root.app = CyBotGUI(root, host=args.host, port=args.port,
+                        split_mode=args.split, diagnostics=args.diagnostics, replay=args.replay)
+    return root
+
+
+def open_login(args):
+    import GUI
+    return GUI.build_window()
+
+
+MODES = {
+    "ping": open_ping,
+    "map": open_map,
+    "login": open_login,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="CyBot dashboard launcher")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--ping", dest="mode", action="store_const", const="ping",
+                      help="PING sensor readout and manual control")
+    mode.add_argument("--map", dest="mode", action="store_const", const="map",
+                      help="mission control map (default)")
+    mode.add_argument("--login", dest="mode", action="store_const", const="login",
+                      help="login shell (customtkinter)")
+    parser.set_defaults(mode="map")
+
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--split", action="store_true",
+                        help="map mode: parse telemetry in a worker process")
+    parser.add_argument("--diagnostics", action="store_true",
+                        help="map mode: open the profiler panel at startup")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="map mode: open a saved mission timeline instead of connecting")
+    parser.add_argument("--startup-probe", action="store_true",
+                        help="print seconds until the window is first drawn, then exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    root = MODES[args.mode](args)
+
+    if args.startup_probe:
+        # First full draw of the window counts as "usable"
+        root.update()
+        print(f"READY {time.perf_counter() - START:.4f}", flush=True)
+        handler = root.protocol("WM_DELETE_WINDOW")
+        if handler:
+            root.tk.call(handler)
+        else:
+            root.destroy()
+        return
+
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import math
+
+# --- Dead Reckoning ---
+# Pose tracking from the CyBot's MOV/TURN reports and placement of OBJ scans.
+# Shared by the in-process GUI and the split-mode worker so both compute the
+# same path. Headings are in degrees, counterclockwise from +x.
+
+
+class DeadReckoner:
+    def __init__(self, x=0.0, y=0.0, heading=90.0):
+        self.bot_x = x
+        self.bot_y = y
+        self.bot_heading = heading
+
+    def update_position(self, move_dist, turn_angle):
+        # 1. Update Heading
+        self.bot_heading = (self.bot_heading + turn_angle) % 360
+
+        # 2. Update Position
+        rad = math.radians(self.bot_heading)
+        self.bot_x += math.cos(rad) * move_dist
+        self.bot_y += math.sin(rad) * move_dist
+        return self.bot_x, self.bot_y, self.bot_heading
+
+    def locate_object(self, scan_angle, dist):
+        # Absolute angle of the object from the robot's heading and the scan angle
+        abs_angle_rad = math.radians(self.bot_heading + scan_angle)
+        obj_x = self.bot_x + (math.cos(abs_angle_rad) * dist)
+        obj_y = self.bot_y + (math.sin(abs_angle_rad) * dist)
+        return obj_x, obj_y
@@ -0,0 +1,236 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+import tkinter as tk
+import tracemalloc
+from collections import deque
+from tkinter import scrolledtext
+
+# --- Diagnostics Mode ---
+# Times the dashboard's hot methods, tracks memory growth with tracemalloc and
+# shows both in a small panel. When disabled nothing is wrapped or traced, so
+# the GUI runs exactly as it does without this module. Snapshot diffs can take
+# seconds on a large heap, so they only run on demand (button or dump).
+
+HOT_METHODS = ("draw_map", "log", "parse_telemetry", "process_queue")
+WINDOW_S = 10.0
+PROFILE_SLICES = 5      # cProfile is rotated every WINDOW_S / PROFILE_SLICES
+REFRESH_MS = 1000
+TOP_N = 8
+
+
+class Diagnostics:
+    def __init__(self, app, methods=HOT_METHODS, window_s=WINDOW_S):
+        self.app = app
+        self.methods = methods
+        self.window_s = window_s
+        self.enabled = False
+        self.samples = deque()  # (end time, method, elapsed seconds)
+        self.profiles = deque()  # (start time, cProfile.Profile); the last one is running
+        self.baseline = None
+        self.started_tracing = False
+        self.panel = None
+        self.refresh_job = None
+        self.last_diff = []
+
+    # --- Toggle ---
+    def toggle(self, event=None):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.samples.clear()
+
+        # Wrap hot methods on the instance only; the class stays untouched
+        for name in self.methods:
+            setattr(self.app, name, self.timed(name, getattr(self.app, name)))
+
+        self.profiles.clear()
+        self.start_profile()
+
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+        self.baseline = tracemalloc.take_snapshot()
+
+        self.open_panel()
+        self.app.log("Sys", "Diagnostics enabled")
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+
+        for name in self.methods:
+            self.app.__dict__.pop(name, None)
+
+        self.profiles[-1][1].disable()
+        self.profiles.clear()
+        if self.started_tracing:
+            tracemalloc.stop()
+        self.baseline = None
+        self.last_diff = []
+
+        if self.refresh_job:
+            self.app.root.after_cancel(self.refresh_job)
+            self.refresh_job = None
+        if self.panel:
+            self.panel.destroy()
+            self.panel = None
+        self.app.log("Sys", "Diagnostics disabled")
+
+    def timed(self, name, func):
+        samples = self.samples
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                samples.append((end, name, end - start))
+
+        return wrapper
+
+    # --- Reports ---
+    def timing_report(self):
+        cutoff = time.perf_counter() - self.window_s
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+
+        totals = {}
+        for _, name, elapsed in self.samples:
+            calls, cum, worst = totals.get(name, (0, 0.0, 0.0))
+            totals[name] = (calls + 1, cum + elapsed, max(worst, elapsed))
+
+        lines = [f"Hot methods, last {self.window_s:.0f}s", f"{'method':<16}{'calls':>7}{'cum ms':>10}{'max ms':>9}"]
+        for name, (calls, cum, worst) in sorted(totals.items(), key=lambda t: t[1][1], reverse=True):
+            lines.append(f"{name:<16}{calls:>7}{cum * 1000:>10.1f}{worst * 1000:>9.2f}")
+        return lines
+
+    # --- Windowed cProfile ---
+    def start_profile(self):
+        profiler = cProfile.Profile()
+        self.profiles.append((time.perf_counter(), profiler))
+        profiler.enable()
+
+    def rotate_profiles(self):
+        # Start a new slice when the running one is old enough, and drop
+        # slices that ended before the window
+        now = time.perf_counter()
+        slice_s = self.window_s / PROFILE_SLICES
+        if now - self.profiles[-1][0] >= slice_s:
+            self.profiles[-1][1].disable()
+            self.start_profile()
+        while len(self.profiles) > 1 and self.profiles[1][0] < now - self.window_s:
+            self.profiles.popleft()
+
+    def window_stats(self, stream=None):
+        # Building Stats disables a profiler, so pause the running slice around it
+        self.rotate_profiles()
+        running = self.profiles[-1][1]
+        running.disable()
+        try:
+            return pstats.Stats(*(p for _, p in self.profiles), stream=stream)
+        finally:
+            running.enable()
+
+    def top_functions(self, limit=TOP_N):
+        stats = self.window_stats().stats
+        # Skip builtins ("~") and this module's own wrappers
+        rows = [(ct, nc, func) for func, (cc, nc, tt, ct, callers) in stats.items()
+                if func[0] not in ("~", __file__)]
+        rows.sort(reverse=True)
+
+        lines = [f"Top functions by cumulative time, last {self.window_s:.0f}s",
+                 f"{'function':<34}{'calls':>7}{'cum ms':>10}"]
+        for ct, nc, (filename, lineno, name) in rows[:limit]:
+            label = f"{os.path.basename(filename)}:{lineno}({name})"
+            lines.append(f"{label[:33]:<34}{nc:>7}{ct * 1000:>10.1f}")
+        return lines
+
+    def profile_report(self, limit=TOP_N):
+        out = io.StringIO()
+        self.window_stats(stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue().splitlines()
+
+    def memory_report(self):
+        # Cheap counters only; safe to run on every panel refresh
+        app = self.app
+        lines = [
+            "Memory",
+            f"path: {len(app.path)} pts  objects: {len(app.objects)}  log: {len(app.log_store)} entries",
+        ]
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"traced: {current / 1024:.0f} KiB  peak: {peak / 1024:.0f} KiB")
+        return lines
+
+    def memory_diff(self, limit=TOP_N):
+        # Allocation growth since diagnostics were enabled (slow on a big heap)
+        if self.baseline is None:
+            return []
+        snapshot = tracemalloc.take_snapshot()
+        lines = [f"Allocation growth since enable ({time.strftime('%H:%M:%S')})"]
+        for stat in snapshot.compare_to(self.baseline, "lineno")[:limit]:
+            frame = stat.traceback[0]
+            lines.append(f"{stat.size_diff / 1024:+8.1f} KiB  {frame.filename.rsplit('/', 1)[-1]}:{frame.lineno}")
+        return lines
+
+    def take_memory_diff(self):
+        self.last_diff = self.memory_diff()
+        self.refresh_panel(reschedule=False)
+
+    def dump(self, path=None):
+        if not self.enabled:
+            return None
+        if path is None:
+            path = time.strftime("cybot_diagnostics_%Y%m%d_%H%M%S.txt")
+        sections = [self.timing_report(), self.memory_report(), self.memory_diff(limit=25),
+                    self.profile_report(limit=40)]
+        with open(path, "w") as f:
+            for section in sections:
+                f.write("\n".join(section) + "\n\n")
+        self.app.log("Sys", f"Diagnostics written to {path}")
+        return path
+
+    # --- Panel ---
+    def open_panel(self):
+        self.panel = tk.Toplevel(self.app.root)
+        self.panel.title("CyBot Diagnostics")
+        self.panel.geometry("520x520")
+        self.panel.configure(bg="#2c3e50")
+        self.panel.protocol("WM_DELETE_WINDOW", self.disable)
+
+        buttons = tk.Frame(self.panel, bg="#2c3e50")
+        buttons.pack(fill=tk.X, padx=5, pady=5)
+        tk.Button(buttons, text="Memory Diff", command=self.take_memory_diff).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        tk.Button(buttons, text="Dump to File", command=self.dump).pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.report_area = scrolledtext.ScrolledText(self.panel, bg="#1a1a1a", fg="#ecf0f1",
+                                                     font=("Consolas", 9), state='disabled')
+        self.report_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 5))
+
+        self.refresh_panel()
+
+    def refresh_panel(self, reschedule=True):
+        if reschedule:
+            self.refresh_job = None
+        if not self.enabled or not self.panel:
+            return
+        lines = self.top_functions() + [""] + self.timing_report() + [""] + self.memory_report()
+        if self.last_diff:
+            lines += [""] + self.last_diff
+        self.report_area.configure(state='normal')
+        self.report_area.delete("1.0", tk.END)
+        self.report_area.insert(tk.END, "\n".join(lines))
+        self.report_area.configure(state='disabled')
+        if reschedule:
+            self.refresh_job = self.app.root.after(REFRESH_MS, self.refresh_panel)
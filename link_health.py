@@ -0,0 +1,163 @@
+import bisect
+import json
+import threading
+import time
+from collections import deque
+
+# --- Link Health Monitor ---
+# Tracks throughput, inter-arrival gaps, stalls and command round trips so a link
+# that is connected but dropping or delaying packets does not look healthy.
+# Fed from the network thread (or from worker records in split mode); all
+# timestamps are time.monotonic() so they compare across processes.
+
+WINDOW_S = 5.0          # Throughput averaging window
+STALL_MS = 1000         # No data for this long while a command awaits its ack = stalled
+ACK_TIMEOUT_S = 5.0     # Unacknowledged commands older than this count as lost
+SLOW_RTT_MS = 500       # Median RTT above this = degraded
+HISTORY_S = 1.0         # Interval between exported history samples
+
+# Inter-arrival gap histogram bucket upper edges (ms); last bucket is open-ended
+GAP_BUCKETS_MS = [10, 50, 100, 250, 500, 1000, 3000]
+
+# Movement keys and the telemetry line that acknowledges them
+ACKS = {'w': "MOV", 's': "MOV", 'a': "TURN", 'd': "TURN"}
+
+HEALTH_COLORS = {
+    "GOOD": "#27ae60",
+    "DEGRADED": "#f39c12",
+    "STALLED": "#e67e22",
+    "DOWN": "#c0392b",
+}
+
+
+class LinkHealth:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connected = False
+        self.chunks = deque()       # (t, bytes) within WINDOW_S
+        self.messages = deque()     # t within WINDOW_S
+        self.last_rx = None
+        self.gap_counts = [0] * (len(GAP_BUCKETS_MS) + 1)
+        self.pending = deque()      # (t, expected ack)
+        self.rtts = deque(maxlen=200)
+        self.lost_acks = 0
+        self.stalls = 0
+        self.stalled = False
+        self.total_bytes = 0
+        self.total_messages = 0
+        self.history = []
+        self.last_history = 0.0
+
+    # --- Events ---
+    def on_connected(self, connected):
+        with self.lock:
+            self.connected = connected
+            self.pending.clear()
+            self.last_rx = time.monotonic() if connected else None
+
+    def on_chunk(self, t, nbytes):
+        with self.lock:
+            if self.last_rx is not None:
+                gap_ms = (t - self.last_rx) * 1000
+                self.gap_counts[bisect.bisect_left(GAP_BUCKETS_MS, gap_ms)] += 1
+            self.last_rx = t
+            self.chunks.append((t, nbytes))
+            self.total_bytes += nbytes
+
+    def on_message(self, line, t):
+        with self.lock:
+            self.messages.append(t)
+            self.total_messages += 1
+
+            kind = line.split(',', 1)[0]
+            if kind in ("MOV", "TURN"):
+                # Acknowledges the oldest outstanding command of the same kind
+                for i, (sent, expected) in enumerate(self.pending):
+                    if expected == kind:
+                        self.rtts.append((t - sent) * 1000)
+                        del self.pending[i]
+                        break
+
+    def on_command(self, char, t):
+        expected = ACKS.get(char)
+        if expected is None:
+            return
+        with self.lock:
+            self.pending.append((t, expected))
+
+    # --- Evaluation (GUI thread) ---
+    def evaluate(self, now=None):
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            cutoff = now - WINDOW_S
+            while self.chunks and self.chunks[0][0] < cutoff:
+                self.chunks.popleft()
+            while self.messages and self.messages[0] < cutoff:
+                self.messages.popleft()
+            while self.pending and now - self.pending[0][0] > ACK_TIMEOUT_S:
+                self.pending.popleft()
+                self.lost_acks += 1
+
+            # The CyBot answers each command with one MOV/TURN and then goes quiet, so
+            # silence only means a stall while a command is still waiting for its ack
+            silent_ms = (now - self.last_rx) * 1000 if self.last_rx is not None else None
+            stalled = False
+            if self.connected and self.pending and self.last_rx is not None:
+                # Count the silence from the later of the last data and the oldest open command
+                waiting_ms = (now - max(self.last_rx, self.pending[0][0])) * 1000
+                stalled = waiting_ms > STALL_MS
+            if stalled and not self.stalled:
+                self.stalls += 1
+            self.stalled = stalled
+
+            rtt = sorted(self.rtts)[len(self.rtts) // 2] if self.rtts else None
+
+            if not self.connected:
+                state = "DOWN"
+            elif stalled:
+                state = "STALLED"
+            elif (rtt is not None and rtt > SLOW_RTT_MS) or self.pending_overdue(now):
+                state = "DEGRADED"
+            else:
+                state = "GOOD"
+
+            summary = {
+                "t": now,
+                "state": state,
+                "bytes_per_s": sum(n for _, n in self.chunks) / WINDOW_S,
+                "msgs_per_s": len(self.messages) / WINDOW_S,
+                "rtt_ms": rtt,
+                "silent_ms": silent_ms,
+                "pending": len(self.pending),
+                "lost_acks": self.lost_acks,
+                "stalls": self.stalls,
+            }
+
+            if now - self.last_history >= HISTORY_S:
+                self.history.append(summary)
+                self.last_history = now
+
+        return summary
+
+    def pending_overdue(self, now):
+        # Commands waiting longer than SLOW_RTT_MS without an ack
+        return bool(self.pending) and (now - self.pending[0][0]) * 1000 > SLOW_RTT_MS
+
+    # --- Export ---
+    def export(self, path=None):
+        if path is None:
+            path = time.strftime("cybot_link_%Y%m%d_%H%M%S.json")
+        summary = self.evaluate()
+        with self.lock:
+            labels = [f"<{edge}ms" for edge in GAP_BUCKETS_MS] + [f">={GAP_BUCKETS_MS[-1]}ms"]
+            report = {
+                "summary": summary,
+                "total_bytes": self.total_bytes,
+                "total_messages": self.total_messages,
+                "gap_histogram": dict(zip(labels, self.gap_counts)),
+                "rtt_samples_ms": list(self.rtts),
+                "history": list(self.history),
+            }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        return path
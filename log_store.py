@@ -0,0 +1,106 @@
+import bisect
+import time
+
+# --- Telemetry Log Store ---
+# Structured in-memory history behind the Telemetry Log widget. Entries are kept
+# in parallel lists with a per-tag index of entry numbers; both are append-only
+# and in time order, so tag and time filters are index lookups / bisects rather
+# than scans. The widget only ever renders the visible page of a LogView.
+
+
+class LogStore:
+    def __init__(self):
+        self.times = []
+        self.tags = []
+        self.msgs = []
+        self.tag_index = {}  # tag -> [entry numbers]
+
+    def __len__(self):
+        return len(self.msgs)
+
+    def append(self, tag, msg, t=None):
+        self.tag_index.setdefault(tag, []).append(len(self.msgs))
+        self.times.append(time.time() if t is None else t)
+        self.tags.append(tag)
+        self.msgs.append(msg)
+
+    def first_at(self, entries, t, lo=0):
+        # Position of the first entry at or after time t within a sorted entry list
+        times = self.times
+        return bisect.bisect_left(entries, t, lo, key=lambda i: times[i])
+
+    def format(self, i):
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.times[i]))
+        return f"{stamp} [{self.tags[i]}] {self.msgs[i]}"
+
+
+class LogView:
+    # Filtered view of a LogStore. Tag/time-only views are windows onto the
+    # store's own lists; text searches keep a match list that is extended
+    # incrementally as new entries arrive. A span (seconds) is a rolling
+    # "last N seconds" window that moves forward on every refresh.
+    def __init__(self, store, tag=None, text="", span=None, base=None):
+        self.store = store
+        self.tag = tag
+        self.text = text.lower()
+        self.span = span
+        self.source = store.tag_index.setdefault(tag, []) if tag else None
+
+        self.lo = 0
+        self.matches = None
+        self.advance_window()
+        self.scanned = self.lo
+        if self.text:
+            if base is not None and base.narrows_to(self):
+                # Typing more characters only needs to re-check the previous matches
+                msgs = store.msgs
+                self.matches = [i for i in base.matches if self.text in msgs[i].lower()]
+                self.scanned = base.scanned
+            else:
+                self.matches = []
+            self.refresh()
+
+    def narrows_to(self, other):
+        return (self.matches is not None and self.tag == other.tag and self.span == other.span
+                and other.text.startswith(self.text))
+
+    def source_len(self):
+        return len(self.source) if self.source is not None else len(self.store)
+
+    def advance_window(self):
+        if self.span is None:
+            return
+        since = time.time() - self.span
+        store = self.store
+        entries = self.source if self.source is not None else range(len(store))
+        # The window only moves forward, so search from the current start
+        self.lo = store.first_at(entries, since, self.lo)
+        if self.matches:
+            del self.matches[:store.first_at(self.matches, since)]
+
+    def refresh(self):
+        self.advance_window()
+        if self.matches is None:
+            return
+        end = self.source_len()
+        msgs = self.store.msgs
+        text = self.text
+        source = self.source
+        for pos in range(max(self.scanned, self.lo), end):
+            i = source[pos] if source is not None else pos
+            if text in msgs[i].lower():
+                self.matches.append(i)
+        self.scanned = end
+
+    def __len__(self):
+        if self.matches is not None:
+            return len(self.matches)
+        return self.source_len() - self.lo
+
+    def page(self, start, count):
+        if self.matches is not None:
+            return self.matches[start:start + count]
+        start += self.lo
+        if self.source is not None:
+            return self.source[start:start + count]
+        return range(start, min(start + count, len(self.store)))
@@ -0,0 +1,233 @@
+import multiprocessing
+import queue
+import socket
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+from dead_reckoning import DeadReckoner
+
+# --- Split Mode Telemetry Worker ---
+# A separate process owns the socket, line splitting, parsing and dead reckoning.
+# Results are published into a shared-memory ring so the GUI process only has to
+# read records and render them, instead of fighting Tk for the GIL.
+
+# Record kinds
+REC_STATUS = 1
+REC_LOG = 2
+REC_RX = 3
+REC_POSE = 4
+REC_OBJ = 5
+REC_REQ = 6
+REC_PARSE_ERR = 7
+REC_SEND_ERR = 8
+REC_CHUNK = 9
+
+RING_CAPACITY = 8192
+TEXT_BYTES = 96  # Text per slot; longer text continues in the following slots
+
+# Header: capacity, write sequence
+HEADER = struct.Struct("<QQ")
+# Record: seq, kind, more, cont, a, b, c, text, seq (repeated so torn reads can be detected)
+# more = 1 means the text continues in the next record, cont = 1 that it began in the previous one
+RECORD = struct.Struct(f"<QBBBddd{TEXT_BYTES}sQ")
+
+
+class ShmRing:
+    # Ring of fixed-size records with one reader. Worker threads share the
+    # producer side, so publish holds a lock while it claims and writes slots.
+    def __init__(self, name=None, capacity=RING_CAPACITY, create=False):
+        if create:
+            size = HEADER.size + capacity * RECORD.size
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            HEADER.pack_into(self.shm.buf, 0, capacity, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.capacity = HEADER.unpack_from(self.shm.buf, 0)[0]
+        self.owner = create
+        self.write_seq = 0
+        self.write_lock = threading.Lock()
+        self.read_seq = 0
+        self.dropped = 0
+        # Text of a record still waiting for its continuation slots
+        self.partial = b""
+        self.joining = False  # Last slot read had more set, so the next one continues it
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    # --- Producer side (worker process) ---
+    def publish(self, kind, a=0.0, b=0.0, c=0.0, text=""):
+        raw = text.encode('utf-8', errors='ignore')
+        chunks = [raw[i:i + TEXT_BYTES] for i in range(0, len(raw), TEXT_BYTES)] or [b""]
+        last = len(chunks) - 1
+        # One lock for all slots of a record so another thread's record can't land between them
+        with self.write_lock:
+            for i, chunk in enumerate(chunks):
+                self.write_record(kind, int(i < last), int(i > 0), a, b, c, chunk)
+
+    def write_record(self, kind, more, cont, a, b, c, raw):
+        seq = self.write_seq + 1
+        offset = HEADER.size + (self.write_seq % self.capacity) * RECORD.size
+        RECORD.pack_into(self.shm.buf, offset, seq, kind, more, cont, a, b, c, raw, seq)
+        # Only advance the shared counter once the record is fully written
+        self.write_seq = seq
+        HEADER.pack_into(self.shm.buf, 0, self.capacity, seq)
+
+    # --- Consumer side (GUI process) ---
+    def read_all(self, limit=None):
+        write_seq = HEADER.unpack_from(self.shm.buf, 0)[1]
+
+        # Writer lapped us: skip to the oldest record still in the ring
+        if write_seq - self.read_seq > self.capacity:
+            self.dropped += write_seq - self.capacity - self.read_seq
+            self.read_seq = write_seq - self.capacity
+            self.partial = b""
+            self.joining = False
+
+        records = []
+        while self.read_seq < write_seq and (limit is None or len(records) < limit):
+            offset = HEADER.size + (self.read_seq % self.capacity) * RECORD.size
+            seq, kind, more, cont, a, b, c, raw, seq_end = RECORD.unpack_from(self.shm.buf, offset)
+            self.read_seq += 1
+            if seq != self.read_seq or seq_end != self.read_seq:
+                # Slot was overwritten while we were reading it
+                self.dropped += 1
+                self.partial = b""
+                self.joining = False
+                continue
+
+            if cont and not self.joining:
+                # Tail of a text whose start was overwritten; counted with the lost slots
+                continue
+            if not cont:
+                self.partial = b""
+
+            # Join continuation slots; bytes are decoded only once the text is complete
+            self.partial += raw.rstrip(b'\x00')
+            self.joining = bool(more)
+            if more:
+                continue
+            records.append((kind, a, b, c, self.partial.decode('utf-8', errors='ignore')))
+            self.partial = b""
+        return records
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def parse_line(raw_str, reckoner, ring):
+    ring.publish(REC_RX, text=raw_str)
+    try:
+        parts = raw_str.split(',')
+        cmd = parts[0]
+
+        if cmd == "MOV":
+            ring.publish(REC_POSE, *reckoner.update_position(float(parts[1]), 0))
+
+        elif cmd == "TURN":
+            ring.publish(REC_POSE, *reckoner.update_position(0, float(parts[1])))
+
+        elif cmd == "OBJ":
+            obj_x, obj_y = reckoner.locate_object(float(parts[1]), float(parts[2]))
+            ring.publish(REC_OBJ, obj_x, obj_y)
+
+        elif cmd == "REQ":
+            message = parts[1] if len(parts) > 1 else "Action required?"
+            ring.publish(REC_REQ, text=message)
+
+    except Exception as e:
+        ring.publish(REC_PARSE_ERR, text=f"{e} in data: {raw_str}")
+
+
+def worker_main(ring_name, cmd_queue, stop_event, host, port):
+    ring = ShmRing(ring_name)
+    reckoner = DeadReckoner()
+    state = {"socket": None}
+
+    # Commands from the GUI are sent from a helper thread so recv never waits on them
+    def sender():
+        while not stop_event.is_set():
+            try:
+                char = cmd_queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            sock = state["socket"]
+            try:
+                sock.sendall(char.encode('utf-8'))
+            except Exception:
+                ring.publish(REC_SEND_ERR, text="Failed to send command")
+
+    threading.Thread(target=sender, daemon=True).start()
+
+    while not stop_event.is_set():
+        try:
+            ring.publish(REC_STATUS, text="CONNECTING...")
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(5)
+            sock.connect((host, port))
+            state["socket"] = sock
+
+            ring.publish(REC_STATUS, text="CONNECTED")
+
+            pending = ""
+            while not stop_event.is_set():
+                try:
+                    data = sock.recv(4096)
+                except socket.timeout:
+                    continue
+                if not data: break
+                # Arrival time and size for the GUI's link health monitor
+                ring.publish(REC_CHUNK, time.monotonic(), len(data))
+                # Keep partial lines across packets
+                pending += data.decode('utf-8', errors='ignore')
+                *lines, pending = pending.split('\n')
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        parse_line(line, reckoner, ring)
+            sock.close()
+
+        except Exception as e:
+            ring.publish(REC_LOG, text=f"Connection Error: {e}")
+            ring.publish(REC_STATUS, text="DISCONNECTED")
+            state["socket"] = None
+            time.sleep(3)
+
+    ring.shm.close()
+
+
+class TelemetryWorker:
+    # GUI-side handle on the worker process and its ring
+    def __init__(self, host, port, capacity=RING_CAPACITY):
+        self.ring = ShmRing(capacity=capacity, create=True)
+        self.cmd_queue = multiprocessing.Queue()
+        self.stop_event = multiprocessing.Event()
+        self.process = multiprocessing.Process(
+            target=worker_main,
+            args=(self.ring.name, self.cmd_queue, self.stop_event, host, port),
+            daemon=True)
+
+    @property
+    def dropped(self):
+        return self.ring.dropped
+
+    def start(self):
+        self.process.start()
+
+    def send(self, char):
+        self.cmd_queue.put(char)
+
+    def poll(self, limit=None):
+        return self.ring.read_all(limit)
+
+    def stop(self):
+        self.stop_event.set()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.ring.close()
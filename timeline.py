@@ -0,0 +1,90 @@
+import bisect
+import json
+from collections import namedtuple
+
+# --- Mission Timeline ---
+# Timestamped pose/object events with periodic checkpoints of the running state.
+# state_at(t) bisects to the event at t, jumps to the checkpoint before it and
+# replays at most CHECKPOINT_EVERY events, instead of replaying the whole mission.
+# Path and objects are append-only in the GUI, so a state is just how many of
+# each existed at time t plus the pose.
+
+CHECKPOINT_EVERY = 256
+
+EV_POSE = 0
+EV_OBJ = 1
+
+TimelineState = namedtuple("TimelineState", "t path_len objects_len x y heading")
+
+
+class Timeline:
+    def __init__(self, x=0.0, y=0.0, heading=90.0, path_len=1):
+        self.times = []
+        self.events = []        # (kind, x, y, heading)
+        self.checkpoints = []   # TimelineState before event checkpoint_at[i]
+        self.checkpoint_at = []
+        # Running state after the last recorded event
+        self.state = TimelineState(None, path_len, 0, x, y, heading)
+
+    def __len__(self):
+        return len(self.events)
+
+    @property
+    def start(self):
+        return self.times[0] if self.times else None
+
+    @property
+    def end(self):
+        return self.times[-1] if self.times else None
+
+    # --- Recording ---
+    def record_pose(self, t, x, y, heading):
+        self.append(t, (EV_POSE, x, y, heading))
+
+    def record_object(self, t, x, y):
+        self.append(t, (EV_OBJ, x, y, 0.0))
+
+    def append(self, t, event):
+        # Clock steps backwards would break the bisect; clamp to keep times sorted
+        if self.times and t < self.times[-1]:
+            t = self.times[-1]
+        if len(self.events) % CHECKPOINT_EVERY == 0:
+            self.checkpoint_at.append(len(self.events))
+            self.checkpoints.append(self.state)
+        self.times.append(t)
+        self.events.append(event)
+        self.state = apply_event(self.state, t, event)
+
+    # --- Seeking ---
+    def state_at(self, t):
+        # Number of events at or before t
+        n = bisect.bisect_right(self.times, t)
+        if n == 0:
+            return self.checkpoints[0]._replace(t=t) if self.checkpoints else self.state
+        c = bisect.bisect_right(self.checkpoint_at, n - 1) - 1
+        state = self.checkpoints[c]
+        for i in range(self.checkpoint_at[c], n):
+            state = apply_event(state, self.times[i], self.events[i])
+        return state._replace(t=t)
+
+    # --- Save / Load ---
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump({"events": [[t, *ev] for t, ev in zip(self.times, self.events)]}, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        timeline = cls()
+        for t, kind, x, y, heading in data["events"]:
+            timeline.append(t, (kind, x, y, heading))
+        return timeline
+
+
+def apply_event(state, t, event):
+    kind, x, y, heading = event
+    if kind == EV_POSE:
+        # Every pose update also appends a path point
+        return TimelineState(t, state.path_len + 1, state.objects_len, x, y, heading)
+    return state._replace(t=t, objects_len=state.objects_len + 1)